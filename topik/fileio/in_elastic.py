@@ -1,8 +1,82 @@
+import logging
+import threading
+
+from six.moves import queue
+
 from ._registry import register_input
 
+# end-of-stream marker for the background producer
+_SENTINEL = object()
+
+
+class _ProducerFailure(object):
+    """Carries an exception from the producer thread to the consumer."""
+    def __init__(self, exception):
+        self.exception = exception
+
+
+def _iter_in_background(iterator, maxsize):
+    """Consume iterator on a daemon thread, yielding items from a bounded queue.
+
+    The next scroll round trip runs while the caller is still processing
+    the previous batch; the queue bound keeps memory flat when the
+    consumer is slower than the network.  Exceptions raised by the
+    iterator are re-raised in the consuming thread.
+
+    When the consumer abandons the generator early, a stop flag unblocks
+    the producer and the source iterator is closed on the producer
+    thread, so helpers.scan gets to run its clear_scroll cleanup instead
+    of holding the server-side scroll context open until it times out.
+    """
+    q = queue.Queue(maxsize=maxsize)
+    stopped = threading.Event()
+
+    def _put(item):
+        """Bounded put that gives up once the consumer has gone away."""
+        while not stopped.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce():
+        try:
+            try:
+                for item in iterator:
+                    if not _put(item):
+                        return
+            except Exception as e:
+                _put(_ProducerFailure(e))
+            _put(_SENTINEL)
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    logging.warning("error closing iterator consumed in background",
+                                    exc_info=True)
+
+    producer = threading.Thread(target=_produce)
+    producer.daemon = True
+    producer.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _SENTINEL:
+                break
+            if isinstance(item, _ProducerFailure):
+                raise item.exception
+            yield item
+    finally:
+        stopped.set()
+
 
 @register_input
-def read_elastic(hosts, **kwargs):
+def read_elastic(hosts, query=None, index=None, scroll='5m',
+                 source_fields=None, batch_size=500, **kwargs):
     """Iterate over all documents in the specified elasticsearch intance and index that match the specified query.
 
     kwargs are passed to Elasticsearch class instantiation, and can be used to pass any additional options
@@ -14,19 +88,39 @@ def read_elastic(hosts, **kwargs):
         Address of the elasticsearch instance any index.  May include port, username and password.
         See https://elasticsearch-py.readthedocs.org/en/master/api.html#elasticsearch for all options.
 
-    content_field : str
-        The name fo the field that contains the main text body of the document.
+    query : dict or None
+        Elasticsearch query body to filter documents server-side.  None matches everything.
+
+    index : str or None
+        Index (or comma-separated indices) to scan.  None scans all indices.
+
+    scroll : str
+        How long the server keeps the scroll context alive between batches.
+
+    source_fields : list of str or None
+        Restrict the _source returned for each document to these fields, so
+        unneeded fields are neither serialized by the server nor shipped
+        over the wire.  None returns the full _source.
+
+    batch_size : int
+        Number of documents fetched per scroll round trip.
 
-    **kwargs: additional keyword arguments to be passed to Elasticsearch client instance and to scan query.
-              See
+    **kwargs: additional keyword arguments to be passed to the Elasticsearch client instance.  See
               https://elasticsearch-py.readthedocs.org/en/master/api.html#elasticsearch for all client options.
-              https://elasticsearch-py.readthedocs.org/en/master/helpers.html#elasticsearch.helpers.scan for all scan options.
     """
     # TODO: add doctest
     from elasticsearch import Elasticsearch, helpers
     es = Elasticsearch(hosts, **kwargs)
-    results = helpers.scan(es, **kwargs)
-    for result in results:
+    if source_fields is not None:
+        query = dict(query) if query else {}
+        query["_source"] = list(source_fields)
+    # preserve_order=False lets scan use the cheap scan search_type rather
+    # than scoring and sorting every batch
+    results = helpers.scan(es, query=query, index=index, scroll=scroll,
+                           size=batch_size, preserve_order=False)
+    # fetch scroll batches on a worker thread while the caller processes
+    # documents; buffer at most two batches ahead
+    for result in _iter_in_background(results, maxsize=2 * batch_size):
         yield result['_source']
 
 
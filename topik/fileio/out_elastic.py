@@ -30,15 +30,23 @@ def es_setitem(key, value, doc_type, instance, index, batch_size=1000):
         helpers.bulk(client=instance, actions=batch, index=index)
     instance.indices.refresh(index)
 
+def _coerce_id(raw_id):
+    """Convert numeric document ids to int, leaving other ids as strings.
+
+    str.isdecimal is a C-level scan of the id characters, so non-numeric
+    ids are rejected without paying exception setup per record the way the
+    old try/except int() did.
+    """
+    if raw_id.isdecimal() or (raw_id[:1] == '-' and raw_id[1:].isdecimal()):
+        return int(raw_id)
+    return raw_id
+
+
 def es_getitem(key, doc_type, instance, index, query=None):
     results = helpers.scan(instance, index=index,
                                query=query, doc_type=doc_type)
     for result in results:
-        try:
-            id = int(result["_id"])
-        except ValueError:
-            id = result["_id"]
-        yield id, result['_source'][key]
+        yield _coerce_id(result["_id"]), result['_source'][key]
 
 class BaseElasticCorpora(UserDict):
     def __init__(self, instance, index, corpus_type, query=None,
@@ -55,12 +55,18 @@ class InMemoryOutput(OutputInterface):
                                                                      filter_field, end))
 
     def get_filtered_data(self, field_to_get, filter=""):
+        # iterate the backing dict directly: GreedyDict.__iter__ yields
+        # values, which makes UserDict.items() misbehave on Python 3
         if not filter:
-            for doc_id, doc in self.corpus.items():
+            for doc_id, doc in self.corpus.data.items():
                 yield doc_id, doc[field_to_get]
         else:
-            for doc_id, doc in self.corpus.items():
-                if eval(filter.format(doc)):
+            # bind each document to a local name and compile the filter
+            # expression once, rather than formatting the document's repr
+            # into the expression and re-parsing it for every record
+            filter_code = compile(filter.format("doc"), "<corpus filter>", "eval")
+            for doc_id, doc in self.corpus.data.items():
+                if eval(filter_code, {"doc": doc}):
                     yield doc_id, doc[field_to_get]
 
     def save(self, filename):
@@ -1,4 +1,3 @@
-import itertools
 import jsonpickle
 import os
 
@@ -137,8 +136,7 @@ class TopikProject(object):
 
     def vectorize(self, method="bag_of_words", **kwargs):
         """Convert tokenized text to vector form - mathematical representation used for modeling."""
-        tokenizer_iterators = itertools.tee(self.selected_tokenized_corpus)
-        vectorized_corpus = vectorizers.vectorize(tokenizer_iterators[0],
+        vectorized_corpus = vectorizers.vectorize(self.selected_tokenized_corpus,
                                                 method=method, **kwargs)
         vectorize_parameter_string = self.corpus_filter + self._selected_tokenized_corpus_id + "_".join([method, _get_parameters_string(**kwargs)])
         # store this internally
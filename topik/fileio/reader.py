@@ -1,8 +1,85 @@
+import itertools
 import os
 
+from six.moves.urllib.parse import urlparse
+
 from topik.fileio._registry import registered_inputs
 from topik.fileio.tests import test_data_path
 
+_json_extensions = (".js", ".json")
+
+# default Elasticsearch HTTP port, used for source auto-detection
+_elastic_port = 9200
+
+
+def _source_port(source):
+    """Return the port of an address-like source, or None.
+
+    Parses the address with urlparse rather than a substring scan, so a
+    file path that merely contains the digits 9200 is not mistaken for a
+    server address.
+    """
+    try:
+        return urlparse(source if "//" in source else "//" + source).port
+    except ValueError:
+        return None
+
+
+def _peek(iterator):
+    """Return (first_item, iterator), where the iterator replays first_item.
+
+    One-shot replacement for itertools.tee: tee would keep buffering every
+    item consumed from one branch while the other sits unused.
+    """
+    first_item = next(iterator)
+    return first_item, itertools.chain([first_item], iterator)
+
+
+def _dispatch_elastic(source, folder_content_field, kwargs):
+    return registered_inputs["read_elastic"](source, **kwargs)
+
+
+def _dispatch_json(source, folder_content_field, kwargs):
+    # Try the json stream parser first, the large_json parser next.
+    try:
+        stream = registered_inputs["read_json_stream"](source, **kwargs)
+        # peek at the first record.  If it fails to decode, this is actually a large_json file.
+        _, stream = _peek(stream)
+        return stream
+    except ValueError:
+        return registered_inputs["read_large_json"](source, **kwargs)
+
+
+def _dispatch_large_json(source, folder_content_field, kwargs):
+    return registered_inputs["read_large_json"](source, **kwargs)
+
+
+def _dispatch_folder(source, folder_content_field, kwargs):
+    return registered_inputs["read_document_folder"](source,
+                                                     content_field=folder_content_field)
+
+
+# dispatch table checked in order; the first predicate that matches
+# (source, source_type, ext) wins.  The extension is split once per
+# read_input call and shared by the predicates.
+_input_dispatch = [
+    # web addresses on the Elasticsearch port default to elasticsearch
+    (lambda source, source_type, ext: source_type == "elastic" or
+        (source_type == "auto" and _source_port(source) == _elastic_port),
+     _dispatch_elastic),
+    # files must end in .json.  Fail otherwise.
+    (lambda source, source_type, ext: source_type == "json_stream" or
+        (source_type == "auto" and ext in _json_extensions),
+     _dispatch_json),
+    (lambda source, source_type, ext: source_type == "large_json",
+     _dispatch_large_json),
+    # folder paths are simple strings that don't end in an extension (.+3-4 characters), or end in a /
+    (lambda source, source_type, ext: source_type == "folder" or
+        (source_type == "auto" and ext == ""),
+     _dispatch_folder),
+]
+
+
 # this function is the primary API for people using any registered functions.
 def read_input(source, source_type="auto", folder_content_field='text', **kwargs):
     """
@@ -43,29 +120,10 @@ def read_input(source, source_type="auto", folder_content_field='text', **kwargs
     >>> solution_text == next(loaded_corpus)['abstract']
     True
     """
-    json_extensions = [".js", ".json"]
-
-    # web addresses default to elasticsearch
-    if (source_type == "auto" and "9200" in source) or source_type == "elastic":
-        data_iterator = registered_inputs["read_elastic"](source, **kwargs)
-    # files must end in .json.  Try json parser first, try large_json parser next.  Fail otherwise.
-    elif (source_type == "auto" and os.path.splitext(source)[1] in json_extensions) or source_type == "json_stream":
-        try:
-            data_iterator = registered_inputs["read_json_stream"](source, **kwargs)
-            # tee the iterator and try to get the first element.  If it fails, this is actually a large_json file.
-            next(data_iterator)
-            # reset the iterator after this check so that it starts at document 0 rather than document 1
-            data_iterator = registered_inputs["read_json_stream"](source, **kwargs)
-        except ValueError:
-            data_iterator = registered_inputs["read_large_json"](source, **kwargs)
-    elif source_type == "large_json":
-        data_iterator = registered_inputs["read_large_json"](source, **kwargs)
-    # folder paths are simple strings that don't end in an extension (.+3-4 characters), or end in a /
-    elif (source_type == "auto" and os.path.splitext(source)[1] == "") or source_type == "folder":
-        data_iterator = registered_inputs["read_document_folder"](source,
-                                                                  content_field=folder_content_field)
-    else:
-        raise ValueError("Unrecognized source type: {}.  Please either manually specify the type, or convert your input"
-                         " to a supported type.".format(source))
-    return data_iterator
+    ext = os.path.splitext(source)[1]
+    for predicate, handler in _input_dispatch:
+        if predicate(source, source_type, ext):
+            return handler(source, folder_content_field, kwargs)
+    raise ValueError("Unrecognized source type: {}.  Please either manually specify the type, or convert your input"
+                     " to a supported type.".format(source))
 
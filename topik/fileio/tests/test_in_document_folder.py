@@ -1,6 +1,13 @@
+import gzip
+import os
+import shutil
+import tempfile
+
 import nose.tools as nt
 
 from topik.fileio import read_document_folder
+from topik.fileio import in_document_folder
+from topik.fileio.in_document_folder import _open_gzip
 from topik.fileio.tests import test_data_path
 from ._solutions import solution_document_folder, solution_document_folder_gz
 
@@ -28,4 +35,48 @@ def test_read_document_folder_gz():
 
 def test_bad_folder():
     nt.assert_raises(IOError, next, read_document_folder("Frank",
-                                                         content_field='theTank'))
\ No newline at end of file
+                                                         content_field='theTank'))
+
+
+def _stub_pigz(script):
+    """Write an executable pigz stand-in, returning (stub_dir, stub_path)."""
+    stub_dir = tempfile.mkdtemp()
+    stub = os.path.join(stub_dir, 'pigz')
+    with open(stub, 'w') as f:
+        f.write(script)
+    os.chmod(stub, 0o755)
+    return stub_dir, stub
+
+
+def test_open_gzip_pigz():
+    gz_path = '{}/test_data_folder_files_gz/doc1.gz'.format(test_data_path)
+    stub_dir, stub = _stub_pigz('#!/bin/sh\nexec gzip -dc "$2"\n')
+    old_pigz = in_document_folder._PIGZ
+    in_document_folder._PIGZ = stub
+    try:
+        with _open_gzip(gz_path) as fd:
+            content = fd.read()
+    finally:
+        in_document_folder._PIGZ = old_pigz
+        shutil.rmtree(stub_dir)
+    with gzip.open(gz_path, 'rb') as fd:
+        nt.assert_equal(content, fd.read())
+
+
+def test_open_gzip_pigz_failure():
+    # a nonzero pigz exit (e.g. corrupt input) must raise, not yield
+    # an empty document
+    gz_path = '{}/test_data_folder_files_gz/doc1.gz'.format(test_data_path)
+    stub_dir, stub = _stub_pigz('#!/bin/sh\necho corrupt >&2\nexit 1\n')
+    old_pigz = in_document_folder._PIGZ
+    in_document_folder._PIGZ = stub
+
+    def read_all():
+        with _open_gzip(gz_path) as fd:
+            fd.read()
+
+    try:
+        nt.assert_raises(IOError, read_all)
+    finally:
+        in_document_folder._PIGZ = old_pigz
+        shutil.rmtree(stub_dir)
\ No newline at end of file
@@ -1,6 +1,10 @@
+import io
+
 import nose.tools as nt
 
-from topik.fileio.in_json import read_json_stream, read_large_json, __is_iterable
+from topik.fileio import in_json
+from topik.fileio.in_json import read_json_stream, read_large_json, \
+    _chunked_lines, __is_iterable
 from topik.fileio.tests import test_data_path
 from ._solutions import solution_json_stream, solution_large_json
 
@@ -26,3 +30,19 @@ def test_read_large_json():
     documents = read_large_json('{}/test_data_large_json.json'.format(test_data_path),
                                json_prefix='item._source.isAuthorOf')
     nt.assert_true(solution_large_json == next(documents)['text'])
+
+
+def test_chunked_lines():
+    data = b"aaa\n" + b"b" * 10 + b"\n\ncccc\nlast-no-newline"
+    expected = [b"aaa\n", b"b" * 10 + b"\n", b"\n", b"cccc\n", b"last-no-newline"]
+    # shrink the read buffer so records span chunk boundaries
+    old_size = in_json._CHUNK_SIZE
+    try:
+        for chunk_size in (1, 2, 3, 7):
+            in_json._CHUNK_SIZE = chunk_size
+            nt.assert_equal(list(_chunked_lines(io.BytesIO(data))), expected)
+    finally:
+        in_json._CHUNK_SIZE = old_size
+    # and with the full-size buffer, where all records share one chunk
+    nt.assert_equal(list(_chunked_lines(io.BytesIO(data))), expected)
+    nt.assert_equal(list(_chunked_lines(io.BytesIO(b""))), [])
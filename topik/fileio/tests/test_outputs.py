@@ -6,7 +6,7 @@ import elasticsearch
 from topik.fileio.base_output import load_output
 from topik.fileio.reader import read_input
 from topik.fileio.tests import test_data_path
-from topik.fileio.out_elastic import ElasticSearchOutput
+from topik.fileio.out_elastic import ElasticSearchOutput, _coerce_id
 from topik.fileio.out_memory import InMemoryOutput
 from elasticsearch.exceptions import ConnectionError
 from nose.plugins.skip import SkipTest
@@ -52,6 +52,17 @@ class BaseOutputTest(object):
                         result_list])
 
 
+class TestCoerceId(unittest.TestCase):
+    def test_numeric_ids(self):
+        self.assertEqual(_coerce_id(u"123"), 123)
+        self.assertEqual(_coerce_id(u"-42"), -42)
+
+    def test_non_numeric_ids(self):
+        self.assertEqual(_coerce_id(u"AVxk12_abc"), u"AVxk12_abc")
+        self.assertEqual(_coerce_id(u"-"), u"-")
+        self.assertEqual(_coerce_id(u""), u"")
+
+
 class TestInMemoryOutput(unittest.TestCase, BaseOutputTest):
     def setUp(self):
         self.test_raw_data = InMemoryOutput()
@@ -1,6 +1,6 @@
 import nose.tools as nt
 
-from topik.fileio.reader import read_input
+from topik.fileio.reader import read_input, _peek
 from topik.fileio.tests import test_data_path
 from ._solutions import solution_json_stream, solution_large_json,\
                         solution_document_folder, solution_document_folder_gz
@@ -28,3 +28,11 @@ def test_read_input():
     nt.assert_true(next(documents)['abstract'] == solution_document_folder_gz)
 
     # TODO: add elastic and solr
+
+
+def test_peek():
+    first_item, stream = _peek(iter([1, 2, 3]))
+    nt.assert_equal(first_item, 1)
+    # the peeked item is replayed at the front of the stream
+    nt.assert_equal(list(stream), [1, 2, 3])
+    nt.assert_raises(StopIteration, _peek, iter([]))